@@ -164,6 +164,7 @@ class StatLogger(metaclass=SingletonMeta):
         # Create a logger
         self.logger = logging.getLogger()  # root logger
         self.logger.setLevel(log_level)
+        self._handlers: list[logging.Handler] = []
 
         iso_formatter = logging.Formatter(
             self._LOG_FORMAT, datefmt=self._LOG_DATE_FORMAT, style="{"
@@ -184,13 +185,13 @@ class StatLogger(metaclass=SingletonMeta):
     def _add_console_logger(self, formatter: logging.Formatter) -> None:
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        self._add_handler(console_handler)
 
     def _add_file_logger(
         self, formatter: logging.Formatter, log_file: str | Path
     ) -> None:
         file_handler = self._create_rotating_file_handler(log_file, formatter)
-        self.logger.addHandler(file_handler)
+        self._add_handler(file_handler)
 
     def _add_jsonl_logger(self, log_file: str | Path, extra_only: bool) -> None:
         jsonl_formatter = JsonlFormatter(
@@ -202,7 +203,19 @@ class StatLogger(metaclass=SingletonMeta):
         )
         if extra_only:
             jsonl_handler.addFilter(NoEmptyExtraLogsFilter())
-        self.logger.addHandler(jsonl_handler)
+        self._add_handler(jsonl_handler)
+
+    def _add_handler(self, handler: logging.Handler) -> None:
+        """Add a handler to the root logger and keep track of it for cleanup."""
+        self.logger.addHandler(handler)
+        self._handlers.append(handler)
+
+    def _close_handlers(self) -> None:
+        """Close and remove the handlers this instance added to the root logger."""
+        for handler in self._handlers:
+            handler.close()
+            self.logger.removeHandler(handler)
+        self._handlers.clear()
 
     @staticmethod
     def _create_rotating_file_handler(
@@ -228,8 +241,14 @@ class StatLogger(metaclass=SingletonMeta):
 
     @classmethod
     def _reset_instance(cls) -> None:
-        """Resets the Singleton instance for testing purposes."""
+        """Resets the Singleton instance for testing purposes.
+
+        The handlers added by the previous instance are closed and removed, so
+        open file handles do not accumulate on the root logger.
+        """
         with cls._lock:
+            if cls._instance is not None:
+                cast(StatLogger, cls._instance)._close_handlers()
             cls._instance = None
 
 
@@ -8,6 +8,7 @@ for example the __DOC.json-files, will not work, because they do not end with "_
 """
 
 import glob
+import string
 from pathlib import Path
 from typing import overload
 
@@ -130,53 +131,41 @@ def get_latest_fileversions(
     else:
         raise TypeError("Expecting glob_list_path to be a str or a list of str.")
 
-    uniques = set()
-    # Compensate for what might be after the version, like "__DOC" in metadata files
-    for file in infiles:
-        if "_v" in file:
-            base_name = file.rsplit("_v", 1)[0]
-            after_v = file.rsplit("_v", 1)[1]
-            i = [char.isdigit() for char in after_v].index(False)
-            uniques.add(base_name + "*" + after_v[i:])
-        else:
-            logger.info(
-                f"File {file} does not follow the naming convention with '_v' for versioning."
-            )
-
-    result = _get_entries_by_uniques(uniques, infiles)
+    result = _get_latest_entries(infiles)
 
     if was_path:
         return [Path(file) for file in result]
     return result
 
 
-def _get_entries_by_uniques(uniques: set[str], infiles: list[str]) -> list[str]:
+def _get_latest_entries(infiles: list[str]) -> list[str]:
+    # Keep the highest version seen so far for each unique file, in a single pass.
+    # The key is the path with the version number swapped out for "*",
+    # to compensate for what might be after the version, like "__DOC" in metadata files.
+    latest: dict[str, tuple[int, str]] = {}
+    for file in infiles:
+        base_name, sep, after_v = file.rpartition("_v")
+        if not sep:
+            logger.info(
+                f"File {file} does not follow the naming convention with '_v' for versioning."
+            )
+            continue
+        after_version = after_v.lstrip(string.digits)
+        version_str = after_v[: len(after_v) - len(after_version)]
+        if not version_str:
+            logger.warning(
+                f"Cannot extract file version from file stem {file}: no digits after '_v'."
+            )
+            continue
+        unique = f"{base_name}*{after_version}"
+        version_number = int(version_str)
+        if unique not in latest or version_number > latest[unique][0]:
+            latest[unique] = (version_number, file)
+
     result: list[str] = []
-    for unique in uniques:
-        # Collect all entries that match the current unique base name
-        entries = [
-            x
-            for x in infiles
-            if "_v" in x
-            and x.rsplit("_v", 1)[0] == unique.rsplit("*", 1)[0]
-            and x.endswith(unique.rsplit("*", 1)[-1])
-        ]  # Characters after match is only digits
-        unique_sorter = []
-
-        for entry in entries:
-            try:
-                # Extract version number using the get_version_number function
-                version_number = get_version_number(entry)
-                unique_sorter.append((version_number, entry))
-            except ValueError as v:
-                logger.warning(
-                    f"Cannot extract file version from file stem {entry}: {v}"
-                )
-        # Sort the collected entries by version number and get the latest one
-        if unique_sorter:
-            latest_entry = max(unique_sorter, key=lambda x: x[0])[1]
-            logger.info(f"Latest version(s): {latest_entry.rsplit('/', 1)[-1]}")
-            result.append(latest_entry)
+    for _, latest_entry in latest.values():
+        logger.info(f"Latest version(s): {latest_entry.rsplit('/', 1)[-1]}")
+        result.append(latest_entry)
     return result
 
 
@@ -277,12 +266,18 @@ def get_fileversions(filepath: str | Path) -> list[str] | list[Path]:
 
 
 @overload
-def latest_version_path(filepath: Path) -> Path: ...
+def latest_version_path(
+    filepath: Path, versions: list[str] | list[Path] | None = None
+) -> Path: ...
 @overload
-def latest_version_path(filepath: str) -> str: ...
+def latest_version_path(
+    filepath: str, versions: list[str] | list[Path] | None = None
+) -> str: ...
 
 
-def latest_version_path(filepath: str | Path) -> str | Path:
+def latest_version_path(
+    filepath: str | Path, versions: list[str] | list[Path] | None = None
+) -> str | Path:
     """Finds the path to the latest version of a specified file.
 
     This function retrieves all versioned files matching the provided file path pattern
@@ -294,6 +289,8 @@ def latest_version_path(filepath: str | Path) -> str | Path:
     Args:
         filepath: The full path of the file, either a GCS path or a local path.
             It should follow the naming standard, including the version indicator.
+        versions: The existing versions of the file, if you already have them from
+            get_fileversions. Saves listing the directory again. If None, they are looked up.
 
     Returns:
         str | Path: The path to the latest version of the file. If no versions are found, returns
@@ -310,8 +307,12 @@ def latest_version_path(filepath: str | Path) -> str | Path:
     """
     was_path = isinstance(filepath, Path)
     file_str = str(filepath)
-    # Retrieve all file versions matching the given filepath pattern.
-    files_list = get_fileversions(file_str)
+    # Retrieve all file versions matching the given filepath pattern, unless we already have them.
+    files_list = (
+        get_fileversions(file_str)
+        if versions is None
+        else [str(file) for file in versions]
+    )
     logger.info(f"Files_list: {files_list}")
 
     # If versioned files are found:
@@ -367,38 +368,47 @@ def latest_version_path(filepath: str | Path) -> str | Path:
         return filepath_default
 
 
-def latest_version_number(filepath: str | Path) -> int:
+def latest_version_number(
+    filepath: str | Path, versions: list[str] | list[Path] | None = None
+) -> int:
     """Function for finding latest version in use for a file.
 
     Args:
         filepath: GCS filepath or local filepath, should be the full path, but needs to follow the naming standard.
             eg. ssb-prod-ofi-skatteregn-data-produkt/skatteregn/inndata/skd_data/2023/skd_p2023-01_v1.parquet
             or /ssb/stammeXX/kortkode/inndata/skd_data/2023/skd_p2023-01_v1.parquet
+        versions: The existing versions of the file, if you already have them from
+            get_fileversions. Saves listing the directory again. If None, they are looked up.
 
     Returns:
         int: The latest version number for the file.
     """
-    return get_version_number(latest_version_path(str(filepath)))
+    return get_version_number(latest_version_path(str(filepath), versions=versions))
 
 
-def next_version_number(filepath: str | Path) -> int:
+def next_version_number(
+    filepath: str | Path, versions: list[str] | list[Path] | None = None
+) -> int:
     """Function for finding next version for a new file.
 
     Args:
         filepath: GCS filepath or local filepath, should be the full path, but needs to follow the naming standard.
             eg. ssb-prod-ofi-skatteregn-data-produkt/skatteregn/inndata/skd_data/2023/skd_p2023-01_v1.parquet
             or /ssb/stammeXX/kortkode/inndata/skd_data/2023/skd_p2023-01_v1.parquet
+        versions: The existing versions of the file, if you already have them from
+            get_fileversions. Saves listing the directory again. If None, they are looked up.
 
     Returns:
         int: The next version number for the file.
     """
     file_str = str(filepath)
-    # Get the list of file versions.
-    versions = silence_logger(get_fileversions, file_str)
+    # Get the list of file versions, unless we already have them.
+    if versions is None:
+        versions = silence_logger(get_fileversions, file_str)
 
     if versions:
-        # Extract the version number from the latest file.
-        current_version_int = latest_version_number(file_str)
+        # Extract the version number from the latest file, reusing the listing above.
+        current_version_int = latest_version_number(file_str, versions=versions)
         # Increment to get the next version number.
         next_version_int = current_version_int + 1
     else:
@@ -430,11 +440,14 @@ def next_version_path(filepath: str | Path) -> str | Path:
     """
     was_path = isinstance(filepath, Path)
     file_str = str(filepath)
+    # List the file versions once, and use the listing for both lookups below.
+    versions = silence_logger(get_fileversions, file_str)
+
     # Determine the next version number by incrementing the highest found version.
-    next_version_number_int = next_version_number(file_str)
+    next_version_number_int = next_version_number(file_str, versions=versions)
 
     # Get the path of the latest version of the specified file.
-    latest_file = silence_logger(latest_version_path, file_str)
+    latest_file = silence_logger(latest_version_path, file_str, versions=versions)
 
     # Extract the version number from the latest version of the file.
     current_version_number_int = get_version_number(latest_file)
@@ -10,6 +10,11 @@ from typing import Any
 from dapla_auth_client import AuthClient
 from dapla_auth_client.const import DaplaRegion
 
+_STAMME_VARIABEL_PATH = "/etc/profile.d/stamme_variabel"
+# Parsed shortcuts, keyed on the file path and its modification time.
+# Only the latest version of the file is kept.
+_SHORTCUT_CACHE: dict[tuple[str, int], dict[str, str]] = {}
+
 
 def check_env(raise_err: bool = True) -> str:
     """Check if you are on Dapla or in prodsone.
@@ -42,6 +47,7 @@ def linux_shortcuts(insert_environ: bool = False) -> dict[str, str]:
     """Manually load the "linux-forkortelser" in as dict.
 
     If the function can find the file they are shared in.
+    The parsed file is cached until its modification time changes.
 
     Args:
         insert_environ: Set to True if you want the dict to be inserted into the
@@ -53,17 +59,21 @@ def linux_shortcuts(insert_environ: bool = False) -> dict[str, str]:
     Raises:
         ValueError: If the stamme_variabel file is wrongly formatted.
     """
-    stm: dict[str, str] = {}
-    with open("/etc/profile.d/stamme_variabel") as stam_var:
-        for line in stam_var:
-            line = line.strip()
-            if line.startswith("export") and "=" in line:
-                line_parts = line.replace("export ", "").split("=")
-                if len(line_parts) != 2:
-                    raise ValueError("Too many equal-signs?")
-                first: str = line_parts[0]  # Helping mypy
-                second: str = line_parts[1]  # Helping mypy
-                stm[first] = second
-                if insert_environ:
-                    os.environ[first] = second
+    path = _STAMME_VARIABEL_PATH
+    key = (path, os.stat(path).st_mtime_ns)
+    if key not in _SHORTCUT_CACHE:
+        parsed: dict[str, str] = {}
+        with open(path) as stam_var:
+            for line in stam_var:
+                line = line.strip()
+                if line.startswith("export") and "=" in line:
+                    first, _, second = line.removeprefix("export ").partition("=")
+                    if "=" in second:
+                        raise ValueError("Too many equal-signs?")
+                    parsed[first] = second
+        _SHORTCUT_CACHE.clear()
+        _SHORTCUT_CACHE[key] = parsed
+    stm = dict(_SHORTCUT_CACHE[key])
+    if insert_environ:
+        os.environ.update(stm)
     return stm
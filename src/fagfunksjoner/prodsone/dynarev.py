@@ -3,12 +3,36 @@ import pandas as pd
 from fagfunksjoner.fagfunksjoner_logger import logger
 from fagfunksjoner.prodsone.oradb import Oracle
 
+# The values are passed as bind variables, so Oracle can reuse the parsed statements.
+_SQL_ALL_DATA = """
+    SELECT *
+    FROM DYNAREV.VW_SKJEMA_DATA
+    WHERE delreg_nr = :delreg_nr
+      AND skjema = :skjema
+      AND enhets_type = 'BEDR'
+      AND rad_nr = 0
+      AND aktiv = 1
+"""
+
+# Column names can not be bound, so the select list is filled in with str.format.
+_SQL_SFU = """
+    SELECT {sfu_select}
+    FROM dsbbase.dlr_enhet_i_delreg_skjema a, dsbbase.dlr_enhet_i_delreg b
+    WHERE a.delreg_nr = b.delreg_nr
+      AND a.ident_nr = b.ident_nr
+      AND a.enhets_type = b.enhets_type
+      AND b.prosedyre IS NULL
+      AND a.delreg_nr = :delreg_nr
+      AND a.skjema_type = :skjema
+"""
+
 
 def dynarev_uttrekk(
     delreg_nr: str,
     skjema: str,
     dublettsjekk: bool = False,
     sfu_cols: str | list[str] | bool | None = None,
+    db: str | None = None,
 ) -> pd.DataFrame | tuple[pd.DataFrame, ...]:
     """Fetches and processes data from the Oracle database using the Oracle class for connection management.
 
@@ -18,6 +42,7 @@ def dynarev_uttrekk(
         dublettsjekk: If True, checks for and returns duplicates.
         sfu_cols: Specify a list of columns for SFU data, or a single column as a string.
             If True picks all columns. If None, skips getting sfu-data.
+        db: Name of the Oracle database. If None, you are asked for it.
 
     Returns:
         pd.DataFrame | tuple[pd.DataFrame]: A dataframe, or tuple of dataframes if you wanted sfu-data / dupe-check.
@@ -25,78 +50,61 @@ def dynarev_uttrekk(
     Raises:
         ValueError: If the sfu_cols parameter does not fit expectations.
     """
-    db_name = input("Name of Oracle Database: ")
+    db_name = db if db is not None else input("Name of Oracle Database: ")
     oracle_conn = Oracle(db=db_name)
+    params = {"delreg_nr": delreg_nr, "skjema": skjema}
 
-    # Use a try to guarantee that the oracle-connection is closed with a finally-clause.
+    # All the queries share one connection, which the context manager closes again.
+    # The finally-clause still clears the credentials if entering the context fails.
     try:
-        query_all_data = f"""
-            SELECT *
-            FROM DYNAREV.VW_SKJEMA_DATA
-            WHERE delreg_nr = {delreg_nr}
-              AND skjema = '{skjema}'
-              AND enhets_type = 'BEDR'
-              AND rad_nr = 0
-              AND aktiv = 1
-        """
-        df_all_data = pd.DataFrame(oracle_conn.select(sql=query_all_data))
-        logger.info(f"Data fetched successfully. Number of rows: {len(df_all_data)}")
+        with oracle_conn:
+            df_all_data = pd.DataFrame(
+                oracle_conn.select(sql=_SQL_ALL_DATA, params=params)
+            )
+            logger.info(
+                f"Data fetched successfully. Number of rows: {len(df_all_data)}"
+            )
 
-        pivot_cols = ["enhets_id", "enhets_type", "delreg_nr", "lopenr", "rad_nr"]
-        df_all_data_pivot = df_all_data.pivot_table(
-            index=pivot_cols, columns="felt_id", values="felt_verdi", aggfunc="first"  # type: ignore[arg-type]
-        ).reset_index()
-        result: list[pd.DataFrame] = [df_all_data_pivot]
+            pivot_cols = ["enhets_id", "enhets_type", "delreg_nr", "lopenr", "rad_nr"]
+            df_all_data_pivot = df_all_data.pivot_table(
+                index=pivot_cols, columns="felt_id", values="felt_verdi", aggfunc="first"  # type: ignore[arg-type]
+            ).reset_index()
+            result: list[pd.DataFrame] = [df_all_data_pivot]
 
-        if dublettsjekk:
-            query_dublett = f"""
-                SELECT enhets_id, COUNT(*) AS antall_skjemaer
-                FROM DYNAREV.VW_SKJEMA_DATA
-                WHERE skjema = '{skjema}'
-                  AND enhets_type = 'BEDR'
-                  AND rad_nr = 0
-                  AND aktiv = 1
-                  AND delreg_nr = {delreg_nr}
-                GROUP BY enhets_id
-                HAVING COUNT(*) > 1
-            """
-            dublett = pd.DataFrame(oracle_conn.select(sql=query_dublett))
-            result.append(dublett)
+            if dublettsjekk:
+                # Same filter as the data query, so the counts come from the fetched rows
+                antall = df_all_data.groupby("enhets_id", sort=False).size()
+                dublett = antall[antall > 1].reset_index(name="antall_skjemaer")
+                result.append(dublett)
 
-        if sfu_cols:
-            # Limit cols we are querying for by making a sql-select string
-            if sfu_cols is True:
-                sfu_select = "b.*"
-            elif isinstance(sfu_cols, str):
-                sfu_select = f"b.{sfu_cols}"
-            elif isinstance(sfu_cols, list) and all(
-                isinstance(item, str) for item in sfu_cols
-            ):
-                sfu_select = ", ".join([f"b.{col}" for col in sfu_cols])
-            else:
-                logger.warning("Invalid sfu_cols parameter.")
-                raise ValueError("Invalid sfu_cols parameter.")
+            if sfu_cols:
+                # Limit cols we are querying for by making a sql-select string
+                if sfu_cols is True:
+                    sfu_select = "b.*"
+                elif isinstance(sfu_cols, str):
+                    sfu_select = f"b.{sfu_cols}"
+                elif isinstance(sfu_cols, list) and all(
+                    isinstance(item, str) for item in sfu_cols
+                ):
+                    sfu_select = ", ".join([f"b.{col}" for col in sfu_cols])
+                else:
+                    logger.warning("Invalid sfu_cols parameter.")
+                    raise ValueError("Invalid sfu_cols parameter.")
 
-            # Use the select string to actually get the sfu-data.
-            query_sfu = f"""
-                SELECT {sfu_select}
-                FROM dsbbase.dlr_enhet_i_delreg_skjema a, dsbbase.dlr_enhet_i_delreg b
-                WHERE a.delreg_nr = b.delreg_nr
-                  AND a.ident_nr = b.ident_nr
-                  AND a.enhets_type = b.enhets_type
-                  AND b.prosedyre IS NULL
-                  AND a.delreg_nr = {delreg_nr}
-                  AND a.skjema_type = '{skjema}'
-            """
-            logger.info(query_sfu)
-            result.append(pd.DataFrame(oracle_conn.select(sql=query_sfu)))
+                # Use the select string to actually get the sfu-data.
+                query_sfu = _SQL_SFU.format(sfu_select=sfu_select)
+                logger.info(query_sfu)
+                result.append(
+                    pd.DataFrame(oracle_conn.select(sql=query_sfu, params=params))
+                )
 
-        if len(result) == 1:
-            return result[0]
-        else:
-            return tuple(result)
+            if len(result) == 1:
+                return result[0]
+            else:
+                return tuple(result)
     except Exception as e:
         logger.warning(f"Failed to execute queries: {e}")
         return pd.DataFrame()
     finally:
-        oracle_conn.close()
+        if hasattr(oracle_conn, "user"):
+            oracle_conn.close()
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
 from getpass import getpass, getuser
 from types import TracebackType
 from typing import Any, cast
@@ -15,6 +17,11 @@ class Oracle:
 
     Note:
         User must remember to call the close method after final use.
+        Inside the context manager, the query methods reuse the open
+        connection instead of connecting again, so they run in the same
+        transaction as the context cursor. A select then sees changes made
+        through the cursor that are not yet committed, and update_or_insert
+        commits those changes together with its own.
 
     Attributes:
         user (str): user id
@@ -56,7 +63,20 @@ class Oracle:
         else:
             self.pw = pw
 
-    def select(self, sql: str) -> list[dict[str, Any]]:
+    @contextmanager
+    def _connection(self) -> Iterator[oracledb.Connection]:
+        """Yield the open connection if in context manager mode, else a new one."""
+        if hasattr(self, "conn"):
+            yield self.conn
+        else:
+            with oracledb.connect(
+                user=self.user, password=self.pw, dsn=self.db
+            ) as conn:
+                yield conn
+
+    def select(
+        self, sql: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Get data from Oracle database with fetchall method.
 
         Method for normal select SQL query. It will do a fetchall procedure.
@@ -64,6 +84,7 @@ class Oracle:
 
         Args:
             sql: the SQL query statement
+            params: values for the bind variables in the SQL query statement
 
         Returns:
             A list of dictionaries of every record, column names as keys.
@@ -73,13 +94,14 @@ class Oracle:
         """
         try:
             # create connection to database
-            with oracledb.connect(
-                user=self.user, password=self.pw, dsn=self.db
-            ) as conn:
+            with self._connection() as conn:
                 # create cursor
                 with conn.cursor() as cur:
-                    # execute the select SQL query
-                    cur.execute(sql)
+                    # execute the select SQL query, with bind variables if given
+                    if params is None:
+                        cur.execute(sql)
+                    else:
+                        cur.execute(sql, params)
                     # gets the column names
                     cols = [c[0].lower() for c in cur.description]
                     # gets the data as a list of tuples
@@ -95,7 +117,8 @@ class Oracle:
 
         Method to do either update or insert SQL query. It is important that
         the SQL query statement and the data column names and values come in
-        correct order to each other.
+        correct order to each other. Inside the context manager, the commit
+        also covers uncommitted changes made through the context cursor.
 
         Args:
             sql: SQL query statement, insert or update.
@@ -106,9 +129,7 @@ class Oracle:
         """
         try:
             # create connection to database
-            with oracledb.connect(
-                user=self.user, password=self.pw, dsn=self.db
-            ) as conn:
+            with self._connection() as conn:
                 # create cursor
                 with conn.cursor() as cur:
                     # execute the update or insert statement to the database
@@ -139,9 +160,7 @@ class Oracle:
         """
         try:
             # create connection to database
-            with oracledb.connect(
-                user=self.user, password=self.pw, dsn=self.db
-            ) as conn:
+            with self._connection() as conn:
                 # create cursor
                 with conn.cursor() as cur:
                     # execute the select SQL query
@@ -174,13 +193,22 @@ class Oracle:
 
         Returns:
             oracledb.Cursor: the cursor
+
+        Raises:
+            Exception: If the cursor can not be opened. The connection is closed first.
         """
         self.conn: oracledb.Connection = oracledb.connect(
             user=self.user, password=self.pw, dsn=self.db
         )  # Avoid Mypy complaining that oracledb is not fully typed
         cast(Any, self.conn).__enter__()
-        self.cur: oracledb.Cursor = self.conn.cursor()
-        cast(Any, self.cur).__enter__()
+        try:
+            self.cur: oracledb.Cursor = self.conn.cursor()
+            cast(Any, self.cur).__enter__()
+        except Exception:
+            # __exit__ will not run, so do not leave the connection open
+            self.conn.close()
+            del self.conn
+            raise
         return self.cur
 
     def __exit__(
@@ -188,12 +216,13 @@ class Oracle:
         exc_type: None | type[BaseException],
         exc_value: None | BaseException,
         traceback: None | TracebackType,
-    ) -> bool:
+    ) -> None:
         """Exit the context manager mode.
 
         When exiting context manager, it closes both cursor and connection,
         as well as closing the class itself. All class attribute values
-        will be deleted as well.
+        will be deleted as well. Exceptions raised inside the block are
+        not suppressed.
         """
         cast(Any, self.cur).__exit__(
             exc_type, exc_value, traceback
@@ -202,4 +231,3 @@ class Oracle:
         self.close()
         del self.cur
         del self.conn
-        return True
@@ -103,12 +103,11 @@ class TestSsbFormat(unittest.TestCase):
     def test_store(self) -> None:
         ssb_format = SsbFormat(self.range_dict)
         assert len(os.listdir(self.path)) == 0
-        format_name = "/test_format"
-        ssb_format.store(output_path=str(self.path) + format_name, force=True)
+        ssb_format.store(output_path=self.path / "test_format", force=True)
         assert len(os.listdir(self.path)) == 1
-        assert Path(str(self.path) + format_name + ".json").exists()
-        ssb_format.store(output_path=str(self.path) + format_name + "2", force=True)
-        assert Path(str(self.path) + format_name + "2.json").exists()
+        assert (self.path / "test_format.json").exists()
+        ssb_format.store(output_path=self.path / "test_format2", force=True)
+        assert (self.path / "test_format2.json").exists()
 
     def tearDown(self) -> None:
         # Clean up test files and folders after tests
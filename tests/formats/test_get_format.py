@@ -37,9 +37,8 @@ class TestGetFormat(unittest.TestCase):
         }
         self.dictionaries = [frmt1, frmt2]
 
-        for k, file_name in enumerate(self.test_files):
-            with open(os.path.join(self.path, file_name), "w") as json_file:
-                json.dump(self.dictionaries[k], json_file)
+        for file_name, frmt in zip(self.test_files, self.dictionaries, strict=True):
+            (self.path / file_name).write_text(json.dumps(frmt))
 
     # @mock.patch("ssb_utdanning.format.formats.get_path", side_effect=mock_get_path)
     def test_get_format(self) -> None:
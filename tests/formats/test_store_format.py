@@ -1,47 +1,23 @@
-import os
-import shutil
-import unittest
 from pathlib import Path
 
-from fagfunksjoner.formats import store_format
-
+import pytest
 
-class TestStoreFormat(unittest.TestCase):
-    def setUp(self) -> None:
-        # Create a temporary folder and add test JSON files for testing
-        template_dir = Path(os.getcwd())
-        self.path = template_dir / "test_formats"
-        # make sure the tree is clean
-        self.tearDown()
-        os.makedirs(self.path, exist_ok=True)
-        self.testfiles = ["file_2023-05-10.json", "anotherfile_2024-01-09.json"]
-        self.frmt1 = dict(
-            zip(
-                [f"key{i}" for i in range(1, 6)],
-                [f"value{j}" for j in range(1, 6)],
-                strict=False,
-            )
-        )
+from fagfunksjoner.formats import store_format
 
-        self.frmt2 = dict(
-            zip(
-                [f"{i}" for i in range(1, 6)],
-                [f"category{j}" for j in range(1, 6)],
-                strict=False,
-            )
-        )
+FRMT1 = {f"key{i}": f"value{i}" for i in range(1, 6)}
 
-    def test_store_format(self) -> None:
-        assert not Path(str(self.path) + "/" + self.testfiles[0]).exists()
-        store_format(self.frmt1, str(self.path) + "/" + self.testfiles[0])
-        assert Path(str(self.path) + "/" + self.testfiles[0]).exists()
 
-        assert not Path(str(self.path) + "/" + self.testfiles[1]).exists()
-        store_format(
-            self.frmt1, str(self.path) + "/" + self.testfiles[1].rsplit(".", 1)[0]
-        )
-        assert Path(str(self.path) + "/" + self.testfiles[1]).exists()
+@pytest.mark.parametrize(
+    "filename, strip_ext",
+    [
+        ("file_2023-05-10.json", False),
+        ("anotherfile_2024-01-09.json", True),
+    ],
+)
+def test_store_format(tmp_path: Path, filename: str, strip_ext: bool) -> None:
+    expected = tmp_path / filename
+    output_path = tmp_path / (filename.rsplit(".", 1)[0] if strip_ext else filename)
 
-    def tearDown(self) -> None:
-        # Clean up test files and folders after tests
-        shutil.rmtree(self.path, ignore_errors=True)
+    assert not expected.exists()
+    store_format(FRMT1, output_path)
+    assert expected.exists()
@@ -1,5 +1,6 @@
 import json
 import logging
+from collections.abc import Iterator
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -9,8 +10,10 @@ from fagfunksjoner.log.statlogger import LoggerType, StatLogger, log_function_en
 
 
 @pytest.fixture(autouse=True)
-def reset_ssb_logger() -> None:
-    """Reset the StatLogger for each test. Necessary because it is a singelton object."""
+def reset_ssb_logger() -> Iterator[None]:
+    """Reset the StatLogger around each test. Necessary because it is a singelton object."""
+    StatLogger._reset_instance()
+    yield
     StatLogger._reset_instance()
 
 
@@ -70,6 +73,21 @@ class TestStatLogger:
         assert logger2 is logger1
         assert get_logger1 is get_logger2
 
+    # Resetting the singleton closes and removes the handlers it added
+    def test_reset_instance_removes_handlers(self, tmp_path) -> None:
+        # Arrange
+        previous_handlers = list(logging.getLogger().handlers)
+        logger = StatLogger(log_file=tmp_path / "app.log")
+        file_handler = logger.logger.handlers[-1]
+
+        # Act
+        StatLogger._reset_instance()
+
+        # Assert
+        assert logging.getLogger().handlers == previous_handlers
+        assert isinstance(file_handler, RotatingFileHandler)
+        assert file_handler.stream is None
+
     # Initialization with invalid logger types raises TypeError
     def test_initialization_with_invalid_logger_types(self):
         # Attempt to initialize StatLogger with invalid logger types
@@ -1,5 +1,5 @@
 from collections.abc import Callable
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
@@ -8,51 +8,54 @@ from fagfunksjoner.paths.versions import next_version_number
 
 @pytest.fixture
 def mock_file_system():
-    # Create a mock file system
-    mock_fs = MagicMock()
+    # Create a mock file system, only exposing what versions.py calls on it
+    mock_fs = Mock(spec=["glob"])
     return mock_fs
 
 
-@patch("fagfunksjoner.paths.versions.gcsfs.GCSFileSystem")
-def test_get_next_version_number(mock_gcsfs: MagicMock, mock_file_system: Callable):
-    mock_gcsfs.return_value = mock_file_system
-
-    # Test cases
-    test_cases = [
-        {
-            "filepath": "ssb-bucket/data/2023/data_file_v1.parquet",
-            "files": [
+@pytest.mark.parametrize(
+    "filepath, files, expected",
+    [
+        (
+            "ssb-bucket/data/2023/data_file_v1.parquet",
+            [
                 "ssb-bucket/data/2023/data_file.parquet",
                 "ssb-bucket/data/2023/data_file_v1.parquet",
                 "ssb-bucket/data/2023/data_file_v3.parquet",
             ],
-            "expected": 4,
-        },
-        {
-            "filepath": "gs://bucket/data/2023/data_file_v1.parquet",
-            "files": [
-                "gs://bucket/data/2023/data_file.parquet"
-                "gs://bucket/data/2023/data_file_v1.parquet"
+            4,
+        ),
+        (
+            "gs://bucket/data/2023/data_file_v1.parquet",
+            [
+                "gs://bucket/data/2023/data_file.parquet",
+                "gs://bucket/data/2023/data_file_v1.parquet",
             ],
-            "expected": 2,
-        },
-        {
-            "filepath": "http://bucket/data/2023/data_file_v1.parquet",
-            "files": [],
-            "expected": 1,
-        },
-    ]
-
-    for case in test_cases:
-        mock_file_system.glob.return_value = case["files"]
-        path: str = case["filepath"]
-
-        # Mocking input if no files are found
-        if not case["files"]:
-            with patch("builtins.input", return_value=str(case["expected"])):
-                result = next_version_number(path)
-        else:
-            result = next_version_number(path)
-        assert (
-            result == case["expected"]
-        ), f"Expected {case['expected']} but got {result}"
+            2,
+        ),
+        (
+            "http://bucket/data/2023/data_file_v1.parquet",
+            [],
+            1,
+        ),
+    ],
+    ids=["ssb-prefix", "gs-prefix", "no-files"],
+)
+@patch("fagfunksjoner.paths.versions.gcsfs.GCSFileSystem")
+def test_get_next_version_number(
+    mock_gcsfs: MagicMock,
+    mock_file_system: Callable,
+    filepath: str,
+    files: list[str],
+    expected: int,
+):
+    mock_gcsfs.return_value = mock_file_system
+    mock_file_system.glob.return_value = files
+
+    # Mocking input if no files are found
+    if not files:
+        with patch("builtins.input", return_value=str(expected)):
+            result = next_version_number(filepath)
+    else:
+        result = next_version_number(filepath)
+    assert result == expected, f"Expected {expected} but got {result}"
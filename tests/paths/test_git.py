@@ -5,46 +5,36 @@ import pytest
 
 from fagfunksjoner.paths.git import name_from_gitconfig, repo_root_dir
 
-
-def test_name_from_gitconfig_found():
-    mock_gitconfig_content = [
-        "[user]\n",
-        "name = John Doe\n",
-    ]
-
-    with mock.patch(
-        "builtins.open", mock.mock_open(read_data="".join(mock_gitconfig_content))
-    ):
-        with mock.patch("os.getcwd", return_value="/home/user/project"):
-            with mock.patch("os.listdir", side_effect=[[], [], [".gitconfig"]]):
-                with mock.patch("os.chdir"):
-                    assert name_from_gitconfig() == "John Doe"
-
-
-def test_name_from_gitconfig_not_found():
-    with mock.patch("os.getcwd", return_value="/home/user/project"):
-        with mock.patch("os.listdir", side_effect=[[] for _ in range(40)]):
-            with mock.patch("os.chdir"):
-                with pytest.raises(FileNotFoundError) as excinfo:
-                    name_from_gitconfig()
-                assert "Couldn't find .gitconfig" in str(excinfo.value)
-
-
-def test_name_from_gitconfig_correct_directory_revert():
-    mock_gitconfig_content = [
-        "[user]\n",
-        "name = John Doe\n",
-    ]
-
-    with mock.patch(
-        "builtins.open", mock.mock_open(read_data="".join(mock_gitconfig_content))
-    ):
-        with mock.patch("os.getcwd", return_value="/home/user/project") as mock_getcwd:
-            with mock.patch("os.listdir", side_effect=[[], [], [".gitconfig"]]):
-                with mock.patch("os.chdir") as mock_chdir:
-                    name_from_gitconfig()
-                    # Ensure os.chdir is called back to the original directory
-                    mock_chdir.assert_any_call(mock_getcwd.return_value)
+MOCK_GITCONFIG_CONTENT = "[user]\nname = John Doe\n"
+
+
+@mock.patch("os.chdir")
+@mock.patch("os.listdir", side_effect=[[], [], [".gitconfig"]])
+@mock.patch("os.getcwd", return_value="/home/user/project")
+@mock.patch("builtins.open", mock.mock_open(read_data=MOCK_GITCONFIG_CONTENT))
+def test_name_from_gitconfig_found(mock_getcwd, mock_listdir, mock_chdir):
+    assert name_from_gitconfig() == "John Doe"
+
+
+@mock.patch("os.chdir")
+@mock.patch("os.listdir", return_value=[])
+@mock.patch("os.getcwd", return_value="/home/user/project")
+def test_name_from_gitconfig_not_found(mock_getcwd, mock_listdir, mock_chdir):
+    with pytest.raises(FileNotFoundError) as excinfo:
+        name_from_gitconfig()
+    assert "Couldn't find .gitconfig" in str(excinfo.value)
+
+
+@mock.patch("os.chdir")
+@mock.patch("os.listdir", side_effect=[[], [], [".gitconfig"]])
+@mock.patch("os.getcwd", return_value="/home/user/project")
+@mock.patch("builtins.open", mock.mock_open(read_data=MOCK_GITCONFIG_CONTENT))
+def test_name_from_gitconfig_correct_directory_revert(
+    mock_getcwd, mock_listdir, mock_chdir
+):
+    name_from_gitconfig()
+    # Ensure os.chdir is called back to the original directory
+    mock_chdir.assert_any_call(mock_getcwd.return_value)
 
 
 def test_repo_root_dir() -> None:
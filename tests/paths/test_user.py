@@ -1,4 +1,3 @@
-import os
 from unittest.mock import patch
 
 import pytest
@@ -7,14 +6,10 @@ from fagfunksjoner.paths.user import find_email, find_user, verify_ssbmail
 
 
 @pytest.fixture
-def setup_env():
-    """Fixture to set and reset environment variables."""
-    os.environ["DAPLA_USER"] = "abc@ssb.no"
-    os.environ["JUPYTERHUB_USER"] = "def@ssb.no"
-    yield
-    # Clean up environment variables after the test
-    os.environ.pop("DAPLA_USER", None)
-    os.environ.pop("JUPYTERHUB_USER", None)
+def setup_env(monkeypatch):
+    """Fixture to set environment variables, monkeypatch restores them after the test."""
+    monkeypatch.setenv("DAPLA_USER", "abc@ssb.no")
+    monkeypatch.setenv("JUPYTERHUB_USER", "def@ssb.no")
 
 
 def test_verify_ssbmail():
@@ -29,22 +24,22 @@ def test_find_email_dapla_user(setup_env):
     assert find_user() == "abc"
 
 
-def test_find_email_jupyterhub_user(setup_env):
-    os.environ.pop("DAPLA_USER", None)  # Remove DAPLA_USER
+def test_find_email_jupyterhub_user(setup_env, monkeypatch):
+    monkeypatch.delenv("DAPLA_USER", raising=False)  # Remove DAPLA_USER
     assert find_email() == "def@ssb.no"
 
 
-def test_find_email_git_user(setup_env):
-    os.environ.pop("DAPLA_USER", None)
-    os.environ.pop("JUPYTERHUB_USER", None)
+def test_find_email_git_user(setup_env, monkeypatch):
+    monkeypatch.delenv("DAPLA_USER", raising=False)
+    monkeypatch.delenv("JUPYTERHUB_USER", raising=False)
     with patch("subprocess.run") as mock_subprocess:
         mock_subprocess.return_value.stdout = "ghi"
         assert find_email() == "ghi@ssb.no"
 
 
-def test_find_email_getpass_user(setup_env):
-    os.environ.pop("DAPLA_USER", None)
-    os.environ.pop("JUPYTERHUB_USER", None)
+def test_find_email_getpass_user(setup_env, monkeypatch):
+    monkeypatch.delenv("DAPLA_USER", raising=False)
+    monkeypatch.delenv("JUPYTERHUB_USER", raising=False)
     with (
         patch("subprocess.run") as mock_subprocess,
         patch("getpass.getuser") as mock_getuser,
@@ -54,9 +49,9 @@ def test_find_email_getpass_user(setup_env):
         assert find_email() == "jkl@ssb.no"
 
 
-def test_find_email_raises_value_error(setup_env):
-    os.environ.pop("DAPLA_USER", None)
-    os.environ.pop("JUPYTERHUB_USER", None)
+def test_find_email_raises_value_error(setup_env, monkeypatch):
+    monkeypatch.delenv("DAPLA_USER", raising=False)
+    monkeypatch.delenv("JUPYTERHUB_USER", raising=False)
     with (
         patch("subprocess.run") as mock_subprocess,
         patch("getpass.getuser") as mock_getuser,
@@ -69,11 +64,11 @@ def test_find_email_raises_value_error(setup_env):
             find_email()
 
 
-def test_find_user(setup_env):
+def test_find_user(setup_env, monkeypatch):
     assert find_user() == "abc"
-    os.environ.pop("DAPLA_USER", None)
+    monkeypatch.delenv("DAPLA_USER", raising=False)
     assert find_user() == "def"
-    os.environ.pop("JUPYTERHUB_USER", None)
+    monkeypatch.delenv("JUPYTERHUB_USER", raising=False)
     with patch("subprocess.run") as mock_subprocess:
         mock_subprocess.return_value.stdout = "ghi@ssb.no"
         assert find_user() == "ghi"
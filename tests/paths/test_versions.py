@@ -1,6 +1,8 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from fagfunksjoner.paths.versions import (
     construct_file_pattern,
     get_fileversions,
@@ -11,6 +13,16 @@ from fagfunksjoner.paths.versions import (
     next_version_path,
 )
 
+VERSIONS_MODULE = "fagfunksjoner.paths.versions"
+
+
+@pytest.fixture(scope="module")
+def gs_versions() -> list[str]:
+    return [
+        "gs://bucket/folder/file_v1.parquet",
+        "gs://bucket/folder/file_v2.parquet",
+    ]
+
 
 # Test for get_latest_fileversions function
 def test_get_latest_fileversions():
@@ -43,6 +55,21 @@ def test_get_latest_fileversions_local():
     assert sorted(get_latest_fileversions(paths)) == sorted(expected)
 
 
+def test_get_latest_fileversions_suffixes_kept_apart():
+    paths = [
+        "/bucket/folder/file_v3.json",
+        "/bucket/folder/file_v5__DOC.json",
+        "/bucket/folder/file_v1",
+        "/bucket/folder/file_v2",
+    ]
+    expected = [
+        "/bucket/folder/file_v3.json",
+        "/bucket/folder/file_v5__DOC.json",
+        "/bucket/folder/file_v2",
+    ]
+    assert sorted(get_latest_fileversions(paths)) == sorted(expected)
+
+
 def test_construct_file_pattern():
     file_path = "/bucket/folder/file_v102__DOC.json"
     expected = "/bucket/folder/file_v*__DOC.json"
@@ -84,37 +111,50 @@ def test_get_fileversions(mock_construct_file_pattern, mock_glob):
     )
 
 
-# Test for `latest_version_path` function with Google Storage path
+# Test for `latest_version_path` function with Google Storage and local paths
+@pytest.mark.parametrize(
+    "versions, filepath, expected",
+    [
+        (
+            [
+                "gs://bucket/folder/file_v1.parquet",
+                "gs://bucket/folder/file_v2.parquet",
+            ],
+            "gs://bucket/folder/file_v1.parquet",
+            "gs://bucket/folder/file_v2.parquet",
+        ),
+        (
+            [
+                "/local/folder/file_v1.parquet",
+                "/local/folder/file_v2.parquet",
+            ],
+            "/local/folder/file_v1.parquet",
+            "/local/folder/file_v2.parquet",
+        ),
+        (
+            [
+                "/local/folder/file_v1__DOC.json",
+                "/local/folder/file_v2__DOC.json",
+            ],
+            "/local/folder/file_v1__DOC.json",
+            "/local/folder/file_v2__DOC.json",
+        ),
+    ],
+    ids=["gs", "local", "local_doc_json"],
+)
 @patch("fagfunksjoner.paths.versions.get_fileversions")
-def test_latest_version_path_gs(mock_get_fileversions):
-    mock_get_fileversions.return_value = [
-        "gs://bucket/folder/file_v1.parquet",
-        "gs://bucket/folder/file_v2.parquet",
-    ]
-    filepath = "gs://bucket/folder/file_v1.parquet"
-    assert latest_version_path(filepath) == "gs://bucket/folder/file_v2.parquet"
+def test_latest_version_path(mock_get_fileversions, versions, filepath, expected):
+    mock_get_fileversions.return_value = versions
+    assert latest_version_path(filepath) == expected
 
 
-# Test for `latest_version_path` function with local path
+# Test that `latest_version_path` does not list the directory again when given versions
 @patch("fagfunksjoner.paths.versions.get_fileversions")
-def test_latest_version_path_local(mock_get_fileversions):
-    mock_get_fileversions.return_value = [
-        "/local/folder/file_v1.parquet",
-        "/local/folder/file_v2.parquet",
-    ]
-    filepath = "/local/folder/file_v1.parquet"
-    assert latest_version_path(filepath) == "/local/folder/file_v2.parquet"
-
-
-# Test for `latest_version_path` function with local path
-@patch("fagfunksjoner.paths.versions.get_fileversions")
-def test_latest_version_path_local_doc_json(mock_get_fileversions):
-    mock_get_fileversions.return_value = [
-        "/local/folder/file_v1__DOC.json",
-        "/local/folder/file_v2__DOC.json",
-    ]
-    filepath = "/local/folder/file_v1__DOC.json"
-    assert latest_version_path(filepath) == "/local/folder/file_v2__DOC.json"
+def test_latest_version_path_known_versions(mock_get_fileversions, gs_versions):
+    filepath = "gs://bucket/folder/file_v1.parquet"
+    result = latest_version_path(filepath, versions=gs_versions)
+    assert result == "gs://bucket/folder/file_v2.parquet"
+    mock_get_fileversions.assert_not_called()
 
 
 # Test for `latest_version_path` function with local path
@@ -130,57 +170,61 @@ def test_latest_version_path_local_path(mock_get_fileversions):
 
 
 # Test for `latest_version_number` function with Google Storage path
-@patch("fagfunksjoner.paths.versions.get_fileversions")
-@patch("fagfunksjoner.paths.versions.latest_version_path")
-def test_latest_version_number_gs(mock_latest_version_path, mock_get_fileversions):
-    mock_get_fileversions.return_value = [
-        "gs://bucket/folder/file_v1.parquet",
-        "gs://bucket/folder/file_v2.parquet",
-    ]
-    mock_latest_version_path.return_value = "gs://bucket/folder/file_v2.parquet"
+def test_latest_version_number_gs(mocker, gs_versions):
+    mocks = mocker.patch.multiple(
+        VERSIONS_MODULE,
+        get_fileversions=mocker.DEFAULT,
+        latest_version_path=mocker.DEFAULT,
+    )
+    mocks["get_fileversions"].return_value = gs_versions
+    mocks["latest_version_path"].return_value = "gs://bucket/folder/file_v2.parquet"
     filepath = "gs://bucket/folder/file_v1.parquet"
     assert latest_version_number(filepath) == 2
 
 
 # Test for `next_version_number` function with Google Storage path
-@patch("fagfunksjoner.paths.versions.get_fileversions")
-@patch("fagfunksjoner.paths.versions.latest_version_path")
-def test_next_version_number(mock_latest_version_path, mock_get_fileversions):
-    mock_get_fileversions.return_value = ["gs://bucket/folder/file_v2.parquet"]
-    mock_latest_version_path.return_value = "gs://bucket/folder/file_v2.parquet"
+def test_next_version_number(mocker):
+    mocks = mocker.patch.multiple(
+        VERSIONS_MODULE,
+        get_fileversions=mocker.DEFAULT,
+        latest_version_path=mocker.DEFAULT,
+    )
+    mocks["get_fileversions"].return_value = ["gs://bucket/folder/file_v2.parquet"]
+    mocks["latest_version_path"].return_value = "gs://bucket/folder/file_v2.parquet"
     filepath = "gs://bucket/folder/file_v2.parquet"
     assert next_version_number(filepath) == 3
 
 
 # Test for `latest_version_path` function to check if it defaults to '_v1'
-@patch("fagfunksjoner.paths.versions.get_fileversions")
-@patch("fagfunksjoner.paths.versions.construct_file_pattern")
-def test_latest_version_path_defaults_to_v1(
-    mock_construct_file_pattern, mock_get_fileversions
-):
-    mock_get_fileversions.return_value = []
-    mock_construct_file_pattern.return_value = "gs://bucket/folder/file_v1.parquet"
+def test_latest_version_path_defaults_to_v1(mocker):
+    mocks = mocker.patch.multiple(
+        VERSIONS_MODULE,
+        get_fileversions=mocker.DEFAULT,
+        construct_file_pattern=mocker.DEFAULT,
+    )
+    mocks["get_fileversions"].return_value = []
+    mocks["construct_file_pattern"].return_value = "gs://bucket/folder/file_v1.parquet"
     filepath = "gs://bucket/folder/file.parquet"
     assert latest_version_path(filepath) == "gs://bucket/folder/file_v1.parquet"
 
 
 # Test for `next_version_path` function with Google Storage path
-@patch("fagfunksjoner.paths.versions.get_fileversions")
-@patch("fagfunksjoner.paths.versions.latest_version_path")
-@patch("fagfunksjoner.paths.versions.get_version_number")
-def test_next_version_path(
-    mock_get_version_number, mock_latest_version_path, mock_get_fileversions
-):
-    mock_get_fileversions.return_value = [
-        "gs://bucket/folder/file_v1.parquet",
-        "gs://bucket/folder/file_v2.parquet",
-    ]
-    mock_latest_version_path.return_value = "gs://bucket/folder/file_v2.parquet"
-    mock_get_version_number.return_value = 2
+def test_next_version_path(mocker, gs_versions):
+    mocks = mocker.patch.multiple(
+        VERSIONS_MODULE,
+        get_fileversions=mocker.DEFAULT,
+        latest_version_path=mocker.DEFAULT,
+        get_version_number=mocker.DEFAULT,
+    )
+    mocks["get_fileversions"].return_value = gs_versions
+    mocks["latest_version_path"].return_value = "gs://bucket/folder/file_v2.parquet"
+    mocks["get_version_number"].return_value = 2
 
     file_path = "gs://bucket/folder/file_v2.parquet"
     expected = "gs://bucket/folder/file_v3.parquet"
     assert next_version_path(file_path) == expected
+    # The versions are listed once and shared between the lookups
+    mocks["get_fileversions"].assert_called_once_with(file_path)
 
 
 def test_several_startswith():
@@ -206,3 +250,7 @@ def test_without_version(mock_get_gcs_file_system):
     mock_get_gcs_file_system.return_value.glob.return_value = file_list
     inputs = "gs://bucket/folder/nevner"
     assert get_fileversions(inputs) == file_list
+    # The version filter is part of the glob pattern, so GCS only lists matching files
+    mock_get_gcs_file_system.return_value.glob.assert_called_once_with(
+        "gs://bucket/folder/nevner_v*.parquet"
+    )
@@ -1,5 +1,4 @@
 import os
-from unittest import mock
 
 import pytest
 from dapla_auth_client.const import DaplaRegion
@@ -7,63 +6,83 @@ from dapla_auth_client.const import DaplaRegion
 from fagfunksjoner.prodsone import check_env
 
 
-def test_check_env_dapla():
-    with mock.patch(
-        "dapla_auth_client.AuthClient.get_dapla_region",
-        return_value=DaplaRegion.DAPLA_LAB,
-    ):
-        assert check_env.check_env() == "DAPLA"
+def _raise_attribute_error() -> None:
+    raise AttributeError
 
 
-def test_check_env_prod():
-    with mock.patch("dapla_auth_client.AuthClient.get_dapla_region", return_value=""):
-        with mock.patch("os.path.isdir", return_value=True):
-            assert check_env.check_env() == "PROD"
+@pytest.mark.parametrize(
+    "get_region, isdir, raise_err, expected, exc",
+    [
+        (lambda: DaplaRegion.DAPLA_LAB, False, True, "DAPLA", None),
+        (lambda: "", True, True, "PROD", None),
+        (_raise_attribute_error, False, False, "UNKNOWN", None),
+        (_raise_attribute_error, False, True, None, OSError),
+    ],
+    ids=["dapla", "prod", "unknown", "raises-error"],
+)
+def test_check_env(monkeypatch, get_region, isdir, raise_err, expected, exc):
+    monkeypatch.setattr(
+        "dapla_auth_client.AuthClient.get_dapla_region", staticmethod(get_region)
+    )
+    monkeypatch.setattr("os.path.isdir", lambda path: isdir)
 
+    if exc is not None:
+        with pytest.raises(
+            exc, match=r"Not on Dapla or in Prodsone, where are we dude\?"
+        ):
+            check_env.check_env(raise_err=raise_err)
+    else:
+        assert check_env.check_env(raise_err=raise_err) == expected
 
-def test_check_env_unknown():
-    with mock.patch(
-        "dapla_auth_client.AuthClient.get_dapla_region", side_effect=AttributeError
-    ):
-        with mock.patch("os.path.isdir", return_value=False):
-            assert check_env.check_env(raise_err=False) == "UNKNOWN"
 
+@pytest.fixture
+def stamme_variabel(tmp_path, monkeypatch):
+    """Point linux_shortcuts at a temporary file, with an empty cache."""
+    path = tmp_path / "stamme_variabel"
+    monkeypatch.setattr(check_env, "_STAMME_VARIABEL_PATH", str(path))
+    monkeypatch.setattr(check_env, "_SHORTCUT_CACHE", {})
+    return path
 
-def test_check_env_raises_error():
-    with mock.patch(
-        "dapla_auth_client.AuthClient.get_dapla_region", side_effect=AttributeError
-    ):
-        with mock.patch("os.path.isdir", return_value=False):
-            try:
-                check_env.check_env(raise_err=True)
-            except OSError as e:
-                assert str(e) == "Not on Dapla or in Prodsone, where are we dude?"
 
+def test_linux_shortcuts(stamme_variabel):
+    stamme_variabel.write_text("export VAR1=value1\nexport VAR2=value2")
 
-def test_linux_shortcuts():
-    file_content = """export VAR1=value1
-export VAR2=value2"""
+    result = check_env.linux_shortcuts()
+    assert result == {"VAR1": "value1", "VAR2": "value2"}
 
-    with mock.patch("builtins.open", mock.mock_open(read_data=file_content)):
-        result = check_env.linux_shortcuts()
-        assert result == {"VAR1": "value1", "VAR2": "value2"}
 
+def test_linux_shortcuts_insert_environ(stamme_variabel, monkeypatch):
+    stamme_variabel.write_text("export VAR1=value1\nexport VAR2=value2")
+    monkeypatch.delenv("VAR1", raising=False)
+    monkeypatch.delenv("VAR2", raising=False)
 
-def test_linux_shortcuts_insert_environ():
-    file_content = """export VAR1=value1
-export VAR2=value2"""
+    result = check_env.linux_shortcuts(insert_environ=True)
+    assert result == {"VAR1": "value1", "VAR2": "value2"}
+    assert os.environ["VAR1"] == "value1"
+    assert os.environ["VAR2"] == "value2"
 
-    with mock.patch("builtins.open", mock.mock_open(read_data=file_content)):
-        with mock.patch.dict(os.environ, {}, clear=True):
-            result = check_env.linux_shortcuts(insert_environ=True)
-            assert result == {"VAR1": "value1", "VAR2": "value2"}
-            assert os.environ["VAR1"] == "value1"
-            assert os.environ["VAR2"] == "value2"
 
+def test_linux_shortcuts_invalid_format(stamme_variabel):
+    stamme_variabel.write_text("export VAR1=value1=value2")
 
-def test_linux_shortcuts_invalid_format():
-    file_content = "export VAR1=value1=value2"
+    with pytest.raises(ValueError):
+        check_env.linux_shortcuts()
 
-    with mock.patch("builtins.open", mock.mock_open(read_data=file_content)):
-        with pytest.raises(ValueError):
-            check_env.linux_shortcuts()
+
+def test_linux_shortcuts_cached_until_modified(stamme_variabel, monkeypatch):
+    stamme_variabel.write_text("export VAR1=value1")
+    assert check_env.linux_shortcuts() == {"VAR1": "value1"}
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("The cached file should not be read again")
+
+    with monkeypatch.context() as patch_open:
+        patch_open.setattr("builtins.open", fail_open)
+        assert check_env.linux_shortcuts() == {"VAR1": "value1"}
+
+    stamme_variabel.write_text("export VAR1=changed")
+    mtime_ns = stamme_variabel.stat().st_mtime_ns + 1_000_000_000
+    os.utime(stamme_variabel, ns=(mtime_ns, mtime_ns))
+    assert check_env.linux_shortcuts() == {"VAR1": "changed"}
+    # Older versions of the file are not kept around
+    assert len(check_env._SHORTCUT_CACHE) == 1
@@ -31,11 +31,39 @@ def test_dynarev_uttrekk_no_sfu_cols(mock_oracle):
         )
     ]
 
-    with patch("builtins.input", return_value="test_db"):
-        result = dynarev_uttrekk(delreg_nr="1", skjema="test", sfu_cols=None)
+    result = dynarev_uttrekk(delreg_nr="1", skjema="test", sfu_cols=None, db="test_db")
 
     assert isinstance(result, pd.DataFrame)
     assert not isinstance(result, tuple)
+    # The values are bound as parameters, not formatted into the SQL
+    sql = mock_oracle.select.call_args.kwargs["sql"]
+    assert ":delreg_nr" in sql
+    assert mock_oracle.select.call_args.kwargs["params"] == {
+        "delreg_nr": "1",
+        "skjema": "test",
+    }
+
+
+def test_dynarev_uttrekk_asks_for_db(mock_oracle):
+    mock_oracle.select.side_effect = [
+        pd.DataFrame(
+            {
+                "enhets_id": [1],
+                "enhets_type": ["BEDR"],
+                "delreg_nr": [1],
+                "lopenr": [1],
+                "rad_nr": [0],
+                "felt_id": ["A"],
+                "felt_verdi": [10],
+            }
+        )
+    ]
+
+    with patch("builtins.input", return_value="test_db") as mock_input:
+        result = dynarev_uttrekk(delreg_nr="1", skjema="test")
+
+    mock_input.assert_called_once()
+    assert isinstance(result, pd.DataFrame)
 
 
 def test_dynarev_uttrekk_with_sfu_cols(mock_oracle):
@@ -59,39 +87,51 @@ def test_dynarev_uttrekk_with_sfu_cols(mock_oracle):
         ),
     ]
 
-    with patch("builtins.input", return_value="test_db"):
-        sfu_cols = ["col1", "col2"]
-        result = dynarev_uttrekk(delreg_nr="1", skjema="test", sfu_cols=sfu_cols)
+    sfu_cols = ["col1", "col2"]
+    result = dynarev_uttrekk(
+        delreg_nr="1", skjema="test", sfu_cols=sfu_cols, db="test_db"
+    )
 
     assert isinstance(result, tuple)
     assert len(result) == 2
-    assert set(result[1].columns) == set(sfu_cols)
+    # The SFU columns are selected in the order they were asked for
+    sfu_sql = mock_oracle.select.call_args_list[1].kwargs["sql"]
+    assert "SELECT b.col1, b.col2" in sfu_sql
 
 
 def test_dynarev_uttrekk_dublettsjekk(mock_oracle):
     mock_oracle.select.side_effect = [
         pd.DataFrame(
             {
-                "enhets_id": [1, 2],
-                "enhets_type": ["BEDR", "BEDR"],
-                "delreg_nr": [1, 1],
-                "lopenr": [1, 2],
-                "rad_nr": [0, 0],
-                "felt_id": ["A", "B"],
-                "felt_verdi": [10, 20],
-            }
-        ),
-        pd.DataFrame(
-            {
-                "enhets_id": [1, 2],
-                "antall_skjemaer": [2, 3],
+                "enhets_id": [1, 1, 2, 3, 3, 3],
+                "enhets_type": ["BEDR"] * 6,
+                "delreg_nr": [1] * 6,
+                "lopenr": [1, 2, 1, 1, 2, 3],
+                "rad_nr": [0] * 6,
+                "felt_id": ["A"] * 6,
+                "felt_verdi": [10, 20, 30, 40, 50, 60],
             }
         ),
     ]
 
-    with patch("builtins.input", return_value="test_db"):
-        result = dynarev_uttrekk(delreg_nr="1", skjema="test", dublettsjekk=True)
+    result = dynarev_uttrekk(
+        delreg_nr="1", skjema="test", dublettsjekk=True, db="test_db"
+    )
 
     assert isinstance(result, tuple)
     assert len(result) == 2
-    assert "antall_skjemaer" in result[1].columns
+    # The duplicates are counted from the fetched data, without another query
+    mock_oracle.select.assert_called_once()
+    pd.testing.assert_frame_equal(
+        result[1], pd.DataFrame({"enhets_id": [1, 3], "antall_skjemaer": [2, 3]})
+    )
+
+
+def test_dynarev_uttrekk_closes_when_connect_fails(mock_oracle):
+    mock_oracle.__enter__.side_effect = RuntimeError("invalid password")
+
+    result = dynarev_uttrekk(delreg_nr="1", skjema="test", db="test_db")
+
+    assert isinstance(result, pd.DataFrame)
+    assert result.empty
+    mock_oracle.close.assert_called_once()
@@ -6,15 +6,16 @@ from fagfunksjoner.prodsone.oradb import (
     Oracle,  # Replace 'fagfunksjoner.prodsone.oradb' with the actual module name
 )
 
-# Sample data for testing
+# Sample data for testing, as tuples so no test can change them by accident
 sample_sql = "SELECT * FROM sample_table"
 sample_update_sql = "UPDATE sample_table SET col1 = :1 WHERE col2 = :2"
-sample_data = [("value1", "value2"), ("value3", "value4")]
+sample_data = (("value1", "value2"), ("value3", "value4"))
 sample_batchsize = 2
-sample_result = [
+sample_description = (("COL1",), ("COL2",))
+sample_result = (
     {"col1": "value1", "col2": "value2"},
     {"col1": "value3", "col2": "value4"},
-]
+)
 
 
 @pytest.fixture
@@ -24,51 +25,126 @@ def oracle_instance():
             return Oracle("test_db", "test_pw")
 
 
-@patch("oracledb.connect")
-def test_select(mock_connect, oracle_instance):
-    mock_cursor = MagicMock()
-    mock_cursor.description = [("COL1",), ("COL2",)]
-    mock_cursor.fetchall.return_value = [("value1", "value2"), ("value3", "value4")]
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-    mock_connect.return_value.__enter__.return_value = mock_conn
+@pytest.fixture(autouse=True)
+def mock_connect(monkeypatch):
+    """Replace oracledb.connect for every test, so no test reaches a database."""
+    mock_connect = MagicMock()
+    monkeypatch.setattr("oracledb.connect", mock_connect)
+    return mock_connect
+
+
+class _FakeCursor:
+    """Cursor stub with just the parts of oracledb.Cursor that Oracle uses."""
+
+    def __init__(self, description=None, rows=()):
+        self.description = description
+        self.rows = list(rows)
+        self.executed = []
+        self.fetch_sizes = []
+        self.exited = False
+
+    def execute(self, sql, *params):
+        self.executed.append((sql, *params))
+
+    def executemany(self, sql, data):
+        self.executed.append((sql, data))
+
+    def fetchall(self):
+        return self.rows
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exited = True
+
+
+class _FakeConn:
+    """Connection stub handing out a single _FakeCursor."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.commits = 0
+        self.exited = False
+
+    def cursor(self):
+        return self._cursor
+
+    def commit(self):
+        self.commits += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.exited = True
+
+
+@pytest.fixture(scope="session")
+def mock_oracle_conn_factory():
+    """Return a function wiring a fresh fake cursor and connection to oracledb.connect.
+
+    The fakes return themselves when entered as context managers, so both
+    the query methods and Oracle's own context manager get them.
+    """
+
+    def make(mock_connect, description=None, rows=()):
+        cursor = _FakeCursor(description, rows)
+        conn = _FakeConn(cursor)
+        mock_connect.return_value = conn
+        return cursor, conn
+
+    return make
+
+
+def test_select(mock_connect, oracle_instance, mock_oracle_conn_factory):
+    cursor, _ = mock_oracle_conn_factory(
+        mock_connect, description=sample_description, rows=sample_data
+    )
 
     result = oracle_instance.select(sample_sql)
 
-    assert result == sample_result
-    mock_cursor.execute.assert_called_once_with(sample_sql)
+    assert result == list(sample_result)
+    assert cursor.executed == [(sample_sql,)]
+
 
+def test_select_with_params(mock_connect, oracle_instance, mock_oracle_conn_factory):
+    cursor, _ = mock_oracle_conn_factory(
+        mock_connect, description=sample_description, rows=sample_data
+    )
+    sql = "SELECT * FROM sample_table WHERE col1 = :col1"
 
-@patch("oracledb.connect")
-def test_update_or_insert(mock_connect, oracle_instance):
-    mock_cursor = MagicMock()
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-    mock_connect.return_value.__enter__.return_value = mock_conn
+    result = oracle_instance.select(sql, params={"col1": "value1"})
 
-    oracle_instance.update_or_insert(sample_update_sql, sample_data)
+    assert result == list(sample_result)
+    assert cursor.executed == [(sql, {"col1": "value1"})]
 
-    mock_cursor.executemany.assert_called_once_with(sample_update_sql, sample_data)
-    mock_conn.commit.assert_called_once()
 
+def test_update_or_insert(mock_connect, oracle_instance, mock_oracle_conn_factory):
+    cursor, conn = mock_oracle_conn_factory(mock_connect)
+    update = list(sample_data)
 
-@patch("oracledb.connect")
-def test_select_many(mock_connect, oracle_instance):
-    mock_cursor = MagicMock()
-    mock_cursor.description = [("COL1",), ("COL2",)]
-    mock_cursor.fetchmany.side_effect = [
-        [("value1", "value2"), ("value3", "value4")],
-        [],
-    ]
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
-    mock_connect.return_value.__enter__.return_value = mock_conn
+    oracle_instance.update_or_insert(sample_update_sql, update)
+
+    assert cursor.executed == [(sample_update_sql, update)]
+    assert conn.commits == 1
+
+
+def test_select_many(mock_connect, oracle_instance, mock_oracle_conn_factory):
+    cursor, _ = mock_oracle_conn_factory(
+        mock_connect, description=sample_description, rows=sample_data
+    )
 
     result = oracle_instance.select_many(sample_sql, sample_batchsize)
 
-    assert result == sample_result
-    mock_cursor.execute.assert_called_once_with(sample_sql)
-    mock_cursor.fetchmany.assert_called_with(sample_batchsize)
+    assert result == list(sample_result)
+    assert cursor.executed == [(sample_sql,)]
+    assert cursor.fetch_sizes == [sample_batchsize, sample_batchsize]
 
 
 def test_passw(oracle_instance):
@@ -80,27 +156,58 @@ def test_passw(oracle_instance):
     assert oracle_instance.pw == "direct_pw"
 
 
-@patch("oracledb.connect")
-def test_context_manager(mock_connect, oracle_instance):
-    mock_cursor = MagicMock()
-    mock_conn = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    mock_connect.return_value = mock_conn
+def test_context_manager(mock_connect, oracle_instance, mock_oracle_conn_factory):
+    fake_cursor, fake_conn = mock_oracle_conn_factory(mock_connect)
 
     with oracle_instance as cursor:
-        print("Entering context manager")
         cursor.execute("SELECT 1")
-        print(f"Cursor execute called on: {cursor}")
-        print("Executed query")
 
-    print(f"Mock cursor execute call count: {mock_cursor.execute.call_count}")
-    mock_cursor.execute.assert_called_once_with("SELECT 1")
-    mock_cursor.__exit__.assert_called()
-    mock_conn.__exit__.assert_called()
+    assert fake_cursor.executed == [("SELECT 1",)]
+    assert fake_cursor.exited
+    assert fake_conn.exited
     assert not hasattr(oracle_instance, "cur")
     assert not hasattr(oracle_instance, "conn")
 
 
+def test_context_manager_reuses_connection(
+    mock_connect, oracle_instance, mock_oracle_conn_factory
+):
+    mock_oracle_conn_factory(
+        mock_connect, description=sample_description, rows=sample_data
+    )
+
+    with oracle_instance:
+        first = oracle_instance.select(sample_sql)
+        second = oracle_instance.select(sample_sql)
+
+    assert first == second == list(sample_result)
+    mock_connect.assert_called_once()
+
+
+def test_context_manager_propagates_errors(
+    mock_connect, oracle_instance, mock_oracle_conn_factory
+):
+    _, conn = mock_oracle_conn_factory(mock_connect)
+
+    with pytest.raises(ValueError, match="boom"):
+        with oracle_instance:
+            raise ValueError("boom")
+    assert conn.exited
+
+
+def test_context_manager_closes_connection_when_cursor_fails(
+    mock_connect, oracle_instance
+):
+    mock_conn = mock_connect.return_value
+    mock_conn.cursor.side_effect = RuntimeError("no cursor")
+
+    with pytest.raises(RuntimeError, match="no cursor"):
+        with oracle_instance:
+            pass
+    mock_conn.close.assert_called_once()
+    assert not hasattr(oracle_instance, "conn")
+
+
 def test_close(oracle_instance):
     oracle_instance.close()
     assert not hasattr(oracle_instance, "user")